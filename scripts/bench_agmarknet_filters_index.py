@@ -0,0 +1,134 @@
+"""
+Micro-benchmark: per-request AGMARKNET filter lookups, linear scans vs the
+prebuilt filters index.
+
+Uses the bundled data/agmarknet_filters_snapshot_min.json (no network). For a
+set of commodity/state/district queries it compares:
+ - legacy: the per-call scans `fetch_from_agmarknet_api` used to do over
+   cmdt_data/state_data/district_data plus the weighted-report dictionaries
+   rebuilt over market_data on every call
+ - index: `_get_agmarknet_filters_index()` lookups
+
+Run:
+$ python scripts/bench_agmarknet_filters_index.py
+"""
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+
+def _norm_loc_key(value):
+    s = str(value or '').strip().lower()
+    s = re.sub(r'\b(dist\.?|district)\b', ' ', s)
+    s = re.sub(r'[^a-z0-9]+', ' ', s)
+    return re.sub(r'\s+', ' ', s).strip()
+
+
+def legacy_lookup(filters, commodity, state, district):
+    requested_key = app_module._commodity_lookup_key(commodity)
+    cmdt_match = None
+    for row in filters.get('cmdt_data') or []:
+        name = str((row or {}).get('cmdt_name') or '').strip()
+        if name and app_module._commodity_lookup_key(name) == requested_key:
+            cmdt_match = row
+            break
+
+    state_id = None
+    district_id = None
+    wanted = _norm_loc_key(state)
+    for row in filters.get('state_data') or []:
+        name = str((row or {}).get('state_name') or '').strip()
+        if name and _norm_loc_key(name) == wanted:
+            state_id = row.get('state_id')
+            break
+    if state_id is None:
+        for row in filters.get('state_data') or []:
+            nk = _norm_loc_key((row or {}).get('state_name'))
+            if nk and (nk in wanted or wanted in nk):
+                state_id = row.get('state_id')
+                break
+    if district and state_id is not None:
+        wanted_d = _norm_loc_key(district)
+        for row in filters.get('district_data') or []:
+            if row.get('state_id') == state_id and _norm_loc_key(row.get('district_name')) == wanted_d:
+                district_id = row.get('id')
+                break
+        if district_id is None:
+            for row in filters.get('district_data') or []:
+                if row.get('state_id') != state_id:
+                    continue
+                nk = _norm_loc_key(row.get('district_name'))
+                if nk and (nk in wanted_d or wanted_d in nk):
+                    district_id = row.get('id')
+                    break
+
+    # Weighted-report dictionaries rebuilt per call.
+    district_name_by_id = {}
+    for row in filters.get('district_data') or []:
+        if row.get('id') is not None and row.get('district_name'):
+            district_name_by_id[row['id']] = row['district_name']
+    market_meta_by_key = {}
+    for row in filters.get('market_data') or []:
+        if row.get('mkt_name') and row.get('state_id') is not None:
+            market_meta_by_key[(row['state_id'], _norm_loc_key(row['mkt_name']))] = row
+
+    return (cmdt_match or {}).get('cmdt_id'), state_id, district_id
+
+
+def index_lookup(commodity, state, district):
+    index = app_module._get_agmarknet_filters_index()
+    cmdt_match = index['cmdt_by_key'].get(app_module._commodity_lookup_key(commodity))
+    state_id, district_id = app_module._resolve_agmarknet_location_ids(index, state, district)
+    return (cmdt_match or {}).get('cmdt_id'), state_id, district_id
+
+
+def main():
+    filters = app_module._load_agmarknet_filters_snapshot()
+    if not filters:
+        print('filters snapshot not found')
+        return
+    app_module._store_agmarknet_filters(filters)
+
+    states = [r.get('state_name') for r in filters.get('state_data') or [] if r.get('state_name')]
+    districts = [r.get('district_name') for r in filters.get('district_data') or [] if r.get('district_name')]
+    queries = []
+    for i, commodity in enumerate(app_module.DEFAULT_COMMODITY_NAMES):
+        queries.append((commodity, states[i % len(states)], districts[(i * 37) % len(districts)]))
+        queries.append((commodity, states[(i * 3) % len(states)], None))
+
+    mismatches = [q for q in queries if legacy_lookup(filters, *q) != index_lookup(*q)]
+    print(f'queries={len(queries)} mismatches={len(mismatches)}')
+
+    rounds = 20
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for q in queries:
+            legacy_lookup(filters, *q)
+    legacy_ms = (time.perf_counter() - t0) * 1000.0 / (rounds * len(queries))
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for q in queries:
+            index_lookup(*q)
+    index_ms = (time.perf_counter() - t0) * 1000.0 / (rounds * len(queries))
+
+    t0 = time.perf_counter()
+    app_module._build_agmarknet_filters_index(filters)
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    print(f'legacy per request: {legacy_ms:.3f} ms')
+    print(f'index  per request: {index_ms:.4f} ms')
+    print(f'index build (once per filters refresh): {build_ms:.1f} ms')
+    if index_ms > 0:
+        print(f'speedup: {legacy_ms / index_ms:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Benchmark: AGMARKNET report page parsing, full `r.json()` vs ijson streaming.
+
+A local HTTP server (this process) serves synthetic report pages shaped like
+the real `daily-price-arrival/report` response (records[0].data[0].data rows
+plus pagination). Each mode runs `fetch_from_agmarknet_api` in a fresh child
+process so peak RSS is not polluted by the other run; the child reports the
+peak-RSS growth during the fetch, wall-clock latency and a digest of the rows
+(both modes must return identical rows).
+
+No network access is needed (filters come from the bundled snapshot).
+
+Run:
+$ python scripts/bench_agmarknet_report_stream.py [--rows 20000] [--page-size 2000] [--repeat 3]
+      [--state Maharashtra] [--mbps 20]
+"""
+import argparse
+import hashlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+STATES = ['Maharashtra', 'Karnataka', 'Madhya Pradesh', 'Gujarat', 'Rajasthan', 'Uttar Pradesh']
+
+
+def build_pages(total_rows: int, page_size: int) -> dict:
+    total_pages = max(1, -(-total_rows // page_size))
+    pages = {}
+    n = 0
+    for page in range(1, total_pages + 1):
+        rows = []
+        for _ in range(min(page_size, total_rows - n)):
+            state = STATES[n % len(STATES)]
+            rows.append({
+                'state_name': state,
+                'district_name': f'{state} District {n % 37}',
+                'market_name': f'Market {n % 611}',
+                'variety_name': 'Red' if n % 3 else 'Local',
+                'grade_name': 'FAQ',
+                'min_price': str(1000 + n % 900),
+                'max_price': str(2000 + n % 900),
+                'model_price': str(1500 + n % 900),
+                'unit_name_price': 'Rs./Quintal',
+                'arrival_date': '16-10-2026',
+                'commodity_name': 'Onion',
+                'arrival_quantity': str(n % 250),
+            })
+            n += 1
+        body = {
+            'status': True,
+            'data': {'records': [{
+                'data': [{'title': 'Onion', 'data': rows}],
+                'pagination': [{'total_pages': total_pages, 'current_page': page}],
+            }]},
+        }
+        pages[page] = json.dumps(body).encode('utf-8')
+    return pages
+
+
+def serve(pages: dict, mbps: float = 0.0):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            if parsed.path.endswith('/agmarknet-live-date'):
+                body = json.dumps({'status': 'success', 'data': [{'live_date': '16-10-2026'}]}).encode()
+            elif parsed.path.endswith('/daily-price-arrival/report'):
+                page = int((parse_qs(parsed.query).get('page') or ['1'])[0])
+                body = pages.get(page) or json.dumps({'status': False}).encode()
+            else:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if mbps <= 0:
+                self.wfile.write(body)
+                return
+            # Throttle to emulate a remote upstream: parse can overlap transfer.
+            chunk = 16 * 1024
+            delay = chunk / (mbps * 1024 * 1024 / 8)
+            for i in range(0, len(body), chunk):
+                self.wfile.write(body[i:i + chunk])
+                self.wfile.flush()
+                time.sleep(delay)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def child(base_url: str, state: str):
+    import app as app_module
+
+    app_module.AGMARKNET_V1_API_BASE = base_url
+    # Seed filters so the timing covers only the report fetch.
+    app_module._store_agmarknet_filters(app_module._load_agmarknet_filters_snapshot())
+    before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    rows, err = app_module.fetch_from_agmarknet_api(
+        'Onion', state=state or None, from_date='2026-10-16', to_date='2026-10-16', timeout_seconds=30,
+    )
+    elapsed = time.perf_counter() - t0
+    after_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    digest = hashlib.sha256(json.dumps(rows, sort_keys=True).encode()).hexdigest()[:16]
+    print(json.dumps({
+        'rows': len(rows), 'err': err, 'seconds': elapsed,
+        'peak_rss_growth_mb': (after_kb - before_kb) / 1024.0, 'digest': digest,
+    }))
+
+
+def run_mode(mode: str, base_url: str, state: str, page_size: int) -> dict:
+    env = dict(os.environ)
+    env['AGMARKNET_STREAM_PARSE'] = '1' if mode == 'stream' else '0'
+    env['AGMARKNET_REPORT_PAGE_SIZE'] = str(page_size)
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', base_url, '--state', state or ''],
+        env=env, capture_output=True, text=True, cwd=ROOT,
+    )
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith('{'):
+            return json.loads(line)
+    raise RuntimeError(out.stderr[-2000:])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--page-size', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--state', default='', help='optional state filter, e.g. Maharashtra')
+    parser.add_argument('--mbps', type=float, default=0.0, help='throttle server bandwidth (0 = unthrottled)')
+    parser.add_argument('--child', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.state)
+        return
+
+    import ijson  # noqa: F401  (fail early: the streaming path needs it)
+
+    pages = build_pages(args.rows, args.page_size)
+    server = serve(pages, args.mbps)
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    page_mb = max(len(b) for b in pages.values()) / (1024 * 1024)
+    print(f'rows={args.rows} pages={len(pages)} page_size={args.page_size} largest page={page_mb:.1f} MB state={args.state or "-"} mbps={args.mbps or "-"}')
+
+    results = {}
+    for mode in ('json', 'stream'):
+        runs = [run_mode(mode, base_url, args.state, args.page_size) for _ in range(args.repeat)]
+        results[mode] = runs
+        lat = sorted(r['seconds'] for r in runs)[len(runs) // 2]
+        rss = sorted(r['peak_rss_growth_mb'] for r in runs)[len(runs) // 2]
+        print(f"{mode:>6}: rows={runs[0]['rows']} err={runs[0]['err']} median latency={lat * 1000:.0f} ms "
+              f"median peak RSS growth={rss:.1f} MB digest={runs[0]['digest']}")
+
+    same = results['json'][0]['digest'] == results['stream'][0]['digest']
+    print('identical rows:', same)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
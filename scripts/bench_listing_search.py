@@ -0,0 +1,85 @@
+"""
+Benchmark: marketplace product search, substring scan vs the trigram
+listing search index.
+
+Builds N synthetic approved sell listings (default 50,000; a mix of plain,
+multi-word and Hindi/Tamil product names) and times, per query:
+ - scan:  `q in product.lower()` over every listing (what GET
+          /api/marketplace?q= did)
+ - index: `_ListingSearchIndex.search(q, limit=--page)` (one ranked page)
+
+and prints how many listings each finds. Misspelled and other-language
+queries only match through the index.
+
+Run:
+$ python scripts/bench_listing_search.py
+$ python scripts/bench_listing_search.py --listings 200000 --page 48
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+PRODUCTS = ['Tomato', 'Onion', 'Potato', 'Wheat', 'Rice', 'Maize', 'Cotton', 'Soybean', 'Chilli', 'Banana',
+            'Turmeric', 'Coriander', 'Brinjal', 'Groundnut', 'Sugarcane', 'टमाटर', 'प्याज़', 'आलू', 'தக்காளி', 'வெங்காயம்']
+PREFIXES = ['', '', 'Fresh ', 'Organic ', 'Desi ', 'Red ']
+QUERIES = ['tomato', 'onion', 'tomatto', 'turmerik', 'groundnt', 'टमाटर', 'வெங்காயம்', 'ri', 'organic potato']
+
+
+def make_listing(i, rng):
+    return {
+        'id': 1_600_000_000_000 + i,
+        'user': f'user{rng.randrange(2000)}@example.com',
+        'type': 'sell',
+        'status': 'approved',
+        'product': rng.choice(PREFIXES) + rng.choice(PRODUCTS),
+        'quantity': rng.randint(1, 500),
+        'price': rng.randint(5, 120),
+        'timestamp': 1_700_000_000 + i,
+    }
+
+
+def timed(fn, repeat):
+    samples = []
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples), out
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--listings', type=int, default=50_000)
+    parser.add_argument('--page', type=int, default=48)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    listings = [make_listing(i, rng) for i in range(args.listings)]
+
+    index = app_module._ListingSearchIndex(app_module._product_search_aliases())
+    t0 = time.perf_counter()
+    for listing in listings:
+        index.put(listing)
+    print(f'{args.listings} listings, index build {(time.perf_counter() - t0) * 1000.0:.0f} ms (once per process)')
+
+    print(f'{"query":<16} {"scan ms":>9} {"index ms":>9} {"scan hits":>10} {"index page":>11}')
+    for q in QUERIES:
+        scan_ms, hits = timed(lambda: [o for o in listings if q in (o.get('product') or '').lower()], args.repeat)
+        index_ms, page = timed(lambda: index.search(q, limit=args.page), args.repeat)
+        print(f'{q:<16} {scan_ms:>9.2f} {index_ms:>9.3f} {len(hits):>10} {len(page):>11}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
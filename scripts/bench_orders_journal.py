@@ -0,0 +1,172 @@
+"""
+Benchmark: file-backed orders (no MongoDB), rewrite-the-whole-file helpers vs
+the append-only journal store.
+
+Seeds a temporary data/orders.json with N orders (default 100,000) and times
+single-order operations:
+ - legacy: json.load the file, change one order, json.dump(indent=2) it back
+   (what append_order/update_order_by_id/delete_order_by_id/get_order_by_id did)
+ - journal: `_OrdersJournalStore` put/update/delete/get (one appended line, or
+   an in-memory index lookup)
+
+It then runs --workers processes appending --appends orders each to one store
+and checks that no write was lost.
+
+Run:
+$ python scripts/bench_orders_journal.py
+$ python scripts/bench_orders_journal.py --orders 20000 --ops 50
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+
+def make_order(i, rng):
+    return {
+        'id': 1_600_000_000_000 + i,
+        'user': f'user{rng.randrange(2000)}@example.com',
+        'type': rng.choice(['sell', 'buy']),
+        'product': rng.choice(['Tomato', 'Onion', 'Potato', 'Wheat']),
+        'quantity': rng.randint(1, 500),
+        'price': rng.randint(5, 120),
+        'status': 'approved',
+        'timestamp': time.time(),
+    }
+
+
+# --- legacy helpers (file branch as it was) ---------------------------------
+def _legacy_load(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return []
+
+
+def _legacy_dump(path, orders):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(orders, f, indent=2)
+
+
+def legacy_get(path, oid):
+    for order in _legacy_load(path):
+        if int(order.get('id', 0)) == oid:
+            return order
+    return None
+
+
+def legacy_append(path, order):
+    orders = _legacy_load(path)
+    orders.append(order)
+    _legacy_dump(path, orders)
+
+
+def legacy_update(path, oid, updates):
+    orders = _legacy_load(path)
+    for o in orders:
+        if int(o.get('id', 0)) == oid:
+            o.update(updates)
+            break
+    _legacy_dump(path, orders)
+
+
+def legacy_delete(path, oid):
+    _legacy_dump(path, [o for o in _legacy_load(path) if int(o.get('id', 0)) != oid])
+
+
+def timed(fn, args_list):
+    samples = []
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def _worker(path, worker, appends):
+    store = app_module._OrdersJournalStore(path)
+    for i in range(appends):
+        store.put({'id': 9_000_000_000_000 + worker * 1_000_000 + i, 'user': f'w{worker}', 'type': 'buy'})
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--orders', type=int, default=100_000)
+    parser.add_argument('--ops', type=int, default=20, help='timed operations per kind')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--appends', type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    tmp = tempfile.mkdtemp(prefix='orders_journal_bench_')
+    try:
+        base = [make_order(i, rng) for i in range(args.orders)]
+        legacy_path = os.path.join(tmp, 'legacy', 'orders.json')
+        store_path = os.path.join(tmp, 'journal', 'orders.json')
+        for path in (legacy_path, store_path):
+            os.makedirs(os.path.dirname(path))
+            _legacy_dump(path, base)
+        print(f'{args.orders} orders, snapshot {os.path.getsize(store_path) / 1e6:.1f} MB')
+
+        store = app_module._OrdersJournalStore(store_path)
+        t0 = time.perf_counter()
+        store.all()
+        print(f'journal store index build: {(time.perf_counter() - t0) * 1000.0:.0f} ms (once per process)')
+
+        ids = [o['id'] for o in rng.sample(base, args.ops * 2)]
+        new_orders = [make_order(args.orders + i, rng) for i in range(args.ops)]
+        rows = [
+            ('get_order_by_id', lambda oid: legacy_get(legacy_path, oid), lambda oid: store.get(oid),
+             [(oid,) for oid in ids[:args.ops]]),
+            ('append_order', lambda o: legacy_append(legacy_path, o), lambda o: store.put(o),
+             [(o,) for o in new_orders]),
+            ('update_order_by_id', lambda oid: legacy_update(legacy_path, oid, {'quantity': 1}),
+             lambda oid: store.update(oid, {'quantity': 1}), [(oid,) for oid in ids[:args.ops]]),
+            ('delete_order_by_id', lambda oid: legacy_delete(legacy_path, oid), lambda oid: store.delete(oid),
+             [(oid,) for oid in ids[args.ops:]]),
+        ]
+        print(f'{"operation":<22} {"legacy ms":>10} {"journal ms":>11} {"speedup":>9}')
+        for name, legacy_fn, store_fn, calls in rows:
+            legacy_ms = timed(legacy_fn, calls)
+            store_ms = timed(store_fn, calls)
+            print(f'{name:<22} {legacy_ms:>10.2f} {store_ms:>11.3f} {legacy_ms / max(store_ms, 1e-6):>8.0f}x')
+
+        t0 = time.perf_counter()
+        store.compact()
+        print(f'compaction ({len(store.all())} orders): {(time.perf_counter() - t0) * 1000.0:.0f} ms')
+
+        procs = [
+            multiprocessing.Process(target=_worker, args=(store_path, w, args.appends))
+            for w in range(args.workers)
+        ]
+        t0 = time.perf_counter()
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - t0
+        fresh = app_module._OrdersJournalStore(store_path)
+        written = sum(len(fresh.for_user(f'w{w}')) for w in range(args.workers))
+        expected = args.workers * args.appends
+        print(f'{args.workers} processes x {args.appends} appends: {written}/{expected} present, '
+              f'{expected / elapsed:.0f} appends/s' + ('' if written == expected else '  LOST WRITES'))
+        return 0 if written == expected else 1
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,181 @@
+"""
+Benchmark: order endpoints on a synthetic orders collection, legacy
+`read_orders()` full scans vs the indexed `find_orders()` repository.
+
+Needs a reachable MongoDB (MONGODB_URI, same as the app). Seeds a scratch
+database `<db>_bench_orders` (default 1,000,000 orders: ~2k users, sell
+listings and buy orders with mixed statuses), applies the `orders` index
+migration and times, per endpoint:
+ - before: the handler logic as it was (read_orders() + Python filter/sort)
+ - after:  the current route through the Flask test client
+(the marketplace is compared page by page: the first page and one past a
+cursor half-way through the approved listings)
+
+Both sides must return the same ids; the scratch database is dropped at the
+end unless --keep is given (a kept one is reused when the size matches).
+
+Run:
+$ MONGODB_URI=mongodb://localhost:27017/krishi python scripts/bench_orders_repository.py
+$ MONGODB_URI=... python scripts/bench_orders_repository.py --orders 100000 --repeat 5
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+PRODUCTS = ['Tomato', 'Onion', 'Potato', 'Wheat', 'Rice', 'Maize', 'Cotton', 'Soybean', 'Chilli', 'Banana']
+STATUSES = ['approved'] * 6 + ['pending', 'completed', 'rejected', 'cancelled']
+
+
+def seed(coll, n, users, batch=20000):
+    rng = random.Random(7)
+    now = time.time()
+    docs = []
+    for i in range(n):
+        ts = now - rng.random() * 365 * 86400
+        kind = 'sell' if rng.random() < 0.6 else 'buy'
+        doc = {
+            'id': 1_600_000_000_000 + i,
+            'user': f'user{rng.randrange(users)}@example.com',
+            'type': kind,
+            'product': rng.choice(PRODUCTS),
+            'quantity': rng.randint(1, 500),
+            'price': rng.randint(5, 120),
+            'timestamp': ts,
+        }
+        if kind == 'sell':
+            doc['status'] = rng.choice(STATUSES)
+        docs.append(doc)
+        if len(docs) >= batch:
+            coll.insert_many(docs, ordered=False)
+            docs = []
+    if docs:
+        coll.insert_many(docs, ordered=False)
+
+
+# --- legacy handlers (as before the repository) ---------------------------
+def legacy_list_orders(user):
+    return [o for o in app_module.read_orders() if o.get('user') == user]
+
+
+def legacy_marketplace(q, limit, after=None):
+    orders = app_module.read_orders()
+    filtered = [o for o in orders if q in (o.get('product') or '').lower()] if q else orders
+    filtered = [o for o in filtered if (o.get('type') or 'sell').lower() != 'buy']
+    filtered = [o for o in filtered if (o.get('status') or '').lower() == 'approved']
+    filtered.sort(key=lambda o: (app_module._order_sort_key(o), int(o.get('id'))))
+    if after is not None:
+        filtered = [o for o in filtered if (app_module._order_sort_key(o), int(o.get('id'))) > after]
+    return filtered[:limit]
+
+
+def legacy_admin_orders(req_type, limit):
+    orders = app_module.read_orders()
+    if req_type in ('sell', 'buy'):
+        orders = [o for o in orders if (o.get('type') or 'sell').lower() == req_type]
+    orders = sorted(orders, key=app_module._order_sort_key, reverse=True)
+    return orders[:limit] if limit else orders
+
+
+def legacy_buy_lookup(listing_id):
+    for o in app_module.read_orders():
+        if int(o.get('id')) == int(listing_id) and (o.get('type') or 'sell').lower() == 'sell':
+            return o
+    return None
+
+
+def timed(fn, repeat):
+    samples = []
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples), out
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--orders', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--keep', action='store_true', help='keep the scratch database')
+    args = parser.parse_args()
+
+    mdb = app_module._get_mongo_db()
+    if mdb is None:
+        print('MongoDB not configured (set MONGODB_URI).')
+        return 2
+
+    # Point the app at a scratch database so the real orders are untouched.
+    bench_db = mdb.client[f'{mdb.name}_bench_orders']
+    app_module.mongo_db = bench_db
+    coll = bench_db.get_collection('orders')
+    if coll.estimated_document_count() != args.orders:
+        bench_db.drop_collection('orders')
+        print(f'seeding {args.orders} orders ...')
+        t0 = time.perf_counter()
+        seed(coll, args.orders, args.users)
+        print(f'  seeded in {time.perf_counter() - t0:.1f}s')
+    print('order indexes:', app_module.apply_order_index_migrations(force=True)['version'])
+
+    sample = coll.find_one({'type': 'sell', 'status': 'approved'}, {'_id': 0, 'id': 1, 'user': 1})
+    user = sample['user']
+    listing_id = sample['id']
+
+    client = app_module.app.test_client()
+    with client.session_transaction() as sess:
+        sess['user'] = user
+        sess['admin'] = True
+
+    def route(path, key):
+        def call():
+            resp = client.get(path)
+            assert resp.status_code == 200, (path, resp.status_code)
+            return resp.get_json()[key]
+        return call
+
+    # A cursor half-way through the approved listings, for a deep page.
+    middle = app_module.find_orders(order_type='sell', status='approved', newest_first=False,
+                                    limit=args.orders // 4, fields=('id', 'timestamp'))[-1]
+    cursor = app_module._order_cursor(middle)
+
+    cases = [
+        ('GET /api/orders (own orders)', lambda: legacy_list_orders(user), route('/api/orders', 'orders'), False),
+        ('GET /api/marketplace?q=onion', lambda: legacy_marketplace('onion', 48),
+         route('/api/marketplace?q=onion', 'items'), True),
+        ('GET /api/marketplace?after=<middle>', lambda: legacy_marketplace('', 48, app_module._parse_order_cursor(cursor)),
+         route(f'/api/marketplace?after={cursor}', 'items'), True),
+        ('GET /admin/api/orders?type=sell&limit=50', lambda: legacy_admin_orders('sell', 50),
+         route('/admin/api/orders?type=sell&limit=50', 'orders'), True),
+        ('place_order buy: listing lookup', lambda: [legacy_buy_lookup(listing_id)],
+         lambda: [app_module.get_order_by_id(listing_id)], True),
+    ]
+
+    ok = True
+    print(f'{"endpoint":<44} {"before ms":>11} {"after ms":>10} {"speedup":>8}  rows')
+    for name, before_fn, after_fn, ordered in cases:
+        before_ms, before = timed(before_fn, args.repeat)
+        after_ms, after = timed(after_fn, args.repeat)
+        before_ids = [o.get('id') for o in before if o]
+        after_ids = [o.get('id') for o in after if o]
+        same = before_ids == after_ids if ordered else sorted(before_ids) == sorted(after_ids)
+        ok = ok and same
+        print(f'{name:<44} {before_ms:>11.1f} {after_ms:>10.1f} {before_ms / max(after_ms, 1e-6):>7.1f}x  {len(after_ids)}'
+              + ('' if same else '  MISMATCH'))
+
+    if not args.keep:
+        mdb.client.drop_database(bench_db.name)
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,42 @@
+"""
+Build step: compile data/agmarknet_filters_snapshot_min.json into the compact,
+memory-mappable data/agmarknet_filters_snapshot_min.bin.
+
+The .bin carries fixed-width row tables (each source string stored once) plus
+row indexes sorted by the normalized-name keys, so workers open it with mmap
+instead of parsing JSON and the pages are shared across forked gunicorn
+workers. It records the sha256 of the source JSON; the app ignores a stale
+.bin and falls back to the JSON automatically.
+
+Run (also part of the render.yaml buildCommand):
+$ python scripts/build_agmarknet_filters_snapshot.py [--json PATH] [--out PATH]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile the AGMARKNET filters snapshot')
+    parser.add_argument('--json', default=None, help='source JSON (default: AGMARKNET_FILTERS_SNAPSHOT_PATH)')
+    parser.add_argument('--out', default=None, help='output .bin (default: AGMARKNET_FILTERS_SNAPSHOT_BIN_PATH)')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    info = app_module._compile_agmarknet_filters_snapshot(json_path=args.json, bin_path=args.out)
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    print(f"wrote {info['path']} ({info['bytes']} bytes, source JSON {info['source_bytes']} bytes) in {build_ms:.1f} ms")
+    for table, count in info['rows'].items():
+        print(f'  {table}: {count} rows')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Explain check: case-insensitive mandi queries are served by the
+(commodity_key, state_key, district_key, price_date desc) index.
+
+Needs a reachable MongoDB (MONGODB_URI, same as the app). Writes sample rows
+into scratch copies of the latest/history collections, creates the same
+indexes `_ensure_price_indexes` does, runs `explain()` on the filters built by
+`_mandi_key_query` and fails if any plan has a COLLSCAN, an in-memory SORT, or
+does not use the compound key index. The scratch collections are dropped
+afterwards.
+
+Run:
+$ MONGODB_URI=mongodb://localhost:27017/krishi python scripts/explain_mandi_indexes.py
+"""
+import os
+import sys
+from datetime import date
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+SAMPLE = [
+    ('Onion', 'Maharashtra', 'Nashik', 'Lasalgaon'),
+    ('Onion', 'Maharashtra', 'Pune', 'Pune'),
+    ('Onion', 'Karnataka', 'Bangalore', 'Binny Mill'),
+    ('Tomato', 'Maharashtra', 'Nashik', 'Pimpalgaon'),
+    ('Potato', 'Uttar Pradesh', 'Agra', 'Agra'),
+]
+
+
+def _stages(plan):
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        yield node
+        for key in ('inputStage', 'queryPlan'):
+            if key in node:
+                stack.append(node[key])
+        stack.extend(node.get('inputStages') or [])
+
+
+def _winning_plan(explain):
+    planner = explain.get('queryPlanner') or {}
+    return planner.get('winningPlan') or {}
+
+
+def check(coll, query, sort=None):
+    cursor = coll.find(query, {'_id': 0})
+    if sort:
+        cursor = cursor.sort(*sort)
+    explain = cursor.explain()
+    stages = list(_stages(_winning_plan(explain)))
+    names = [s.get('stage') for s in stages]
+    index_names = {s.get('indexName') for s in stages if s.get('stage') == 'IXSCAN'}
+    stats = explain.get('executionStats') or {}
+    problems = []
+    if 'COLLSCAN' in names:
+        problems.append('COLLSCAN')
+    if 'SORT' in names:
+        problems.append('in-memory SORT')
+    if app_module._MANDI_KEY_INDEX_NAME not in index_names:
+        problems.append(f'key index not used (indexes={sorted(i for i in index_names if i)})')
+    status = 'FAIL' if problems else 'ok'
+    print(
+        f'{status:4} {coll.name:<32} {query} stages={names} '
+        f'keys={stats.get("totalKeysExamined")} docs={stats.get("totalDocsExamined")}'
+        + (f' -> {", ".join(problems)}' if problems else '')
+    )
+    return not problems
+
+
+def main():
+    mdb = app_module._get_mongo_db()
+    if mdb is None:
+        print('MongoDB not configured (set MONGODB_URI).')
+        return 2
+
+    latest = mdb.get_collection('explain_' + app_module.MANDI_PRICE_LATEST_COLLECTION)
+    history = mdb.get_collection('explain_' + app_module.MANDI_PRICE_HISTORY_COLLECTION)
+    try:
+        for coll in (latest, history):
+            coll.drop()
+            coll.create_index('commodity')
+            coll.create_index('state')
+            coll.create_index('district')
+            coll.create_index('price_date')
+            coll.create_index(app_module._MANDI_KEY_INDEX, name=app_module._MANDI_KEY_INDEX_NAME)
+
+        history_docs = []
+        latest_docs = []
+        for commodity, state, district, market in SAMPLE:
+            base = {'commodity': commodity, 'state': state, 'district': district, 'market': market}
+            base.update(app_module._mandi_key_fields(base))
+            latest_docs.append({**base, 'price_date': '2026-10-01', 'modal_price_per_kg': 20.0})
+            for day in range(1, 29):
+                history_docs.append({**base, 'price_date': f'2026-09-{day:02d}', 'modal_price_per_kg': float(day)})
+        latest.insert_many(latest_docs)
+        history.insert_many(history_docs)
+
+        q = app_module._mandi_key_query
+        window = {'from_date': date(2026, 9, 1), 'to_date': date(2026, 9, 30)}
+        ok = all([
+            check(latest, q('ONION')),
+            check(latest, q(' onion ', state='maharashtra')),
+            check(latest, q('Onion', state='Maharashtra', district='NASHIK')),
+            # Without a district the index cannot hand back price_date order,
+            # so only the full-prefix shape is checked with the sort applied.
+            check(history, q('Onion', **window)),
+            check(history, q('onion', state='MAHARASHTRA', **window)),
+            check(history, q('Onion', state='Maharashtra', district='nashik', **window), sort=('price_date', -1)),
+            check(history, q('Onion', state='Maharashtra', district='Nashik', market='lasalgaon', **window)),
+        ])
+    finally:
+        latest.drop()
+        history.drop()
+
+    print('all queries index-served' if ok else 'some queries are not index-served')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
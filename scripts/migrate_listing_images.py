@@ -0,0 +1,51 @@
+"""
+Move listing images stored inline in orders (base64 `image_data`) into the
+content-addressed blob store: the GridFS bucket `listing_images` with MongoDB,
+else data/listing_images/. Orders keep only `image_sha256`, and icons that
+pointed at /api/listing/<id>/image move to /api/images/<sha256>.
+
+With MongoDB this is order index migration 3, applied on first use by the
+one worker holding the `order_image_move` lease (or via
+`scripts/migrate_price_indexes.py --orders`). This script runs the move
+directly on either backend and is safe to re-run.
+
+Run:
+$ python scripts/migrate_listing_images.py             # file-backed orders
+$ MONGODB_URI=... python scripts/migrate_listing_images.py
+$ python scripts/migrate_listing_images.py --dry-run   # only count
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch', type=int, default=50, help='orders per Mongo batch')
+    parser.add_argument('--dry-run', action='store_true', help='only count orders with inline images')
+    args = parser.parse_args()
+
+    coll = app_module.get_orders_collection()
+    if coll is not None:
+        pending = coll.count_documents({'image_data': {'$exists': True}})
+        backend = f'mongo ({coll.database.name}.orders -> GridFS {app_module.LISTING_IMAGE_BUCKET})'
+    else:
+        pending = sum(1 for o in app_module._orders_file_store().all() if 'image_data' in o)
+        backend = 'file store (data/orders.json -> data/listing_images/)'
+    print(f'{backend}: {pending} orders with inline images')
+    if args.dry_run or not pending:
+        return 0
+
+    moved = app_module.migrate_listing_images(batch_size=args.batch)
+    print(f'moved {moved} orders')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
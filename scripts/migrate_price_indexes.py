@@ -0,0 +1,62 @@
+"""
+Apply the versioned price/mandi index migrations (PRICE_INDEX_MIGRATIONS in
+app.py) and record the schema version in schema_migrations/price_indexes.
+`--orders` does the same for ORDER_INDEX_MIGRATIONS (schema_migrations/order_indexes).
+
+Run once per deploy (request handlers never create indexes themselves):
+$ MONGODB_URI=... python scripts/migrate_price_indexes.py
+$ MONGODB_URI=... python scripts/migrate_price_indexes.py --status
+$ MONGODB_URI=... python scripts/migrate_price_indexes.py --force   # re-run every step
+$ MONGODB_URI=... python scripts/migrate_price_indexes.py --orders
+$ MONGODB_URI=... python scripts/migrate_price_indexes.py --wait 0     # fail if a worker is migrating
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--status', action='store_true', help='only print the current and target versions')
+    parser.add_argument('--force', action='store_true', help='re-apply every migration step')
+    parser.add_argument('--orders', action='store_true', help='orders indexes instead of price indexes')
+    parser.add_argument('--wait', type=float, default=app_module.SCHEMA_LEASE_SECONDS,
+                        help='seconds to wait for a worker that is already migrating (default: %(default)s)')
+    args = parser.parse_args()
+    if args.orders:
+        doc_id, migrations, apply = (
+            app_module.ORDER_INDEX_SCHEMA_DOC_ID, app_module.ORDER_INDEX_MIGRATIONS, app_module.apply_order_index_migrations,
+        )
+    else:
+        doc_id, migrations, apply = (
+            app_module.PRICE_INDEX_SCHEMA_DOC_ID, app_module.PRICE_INDEX_MIGRATIONS, app_module.apply_price_index_migrations,
+        )
+
+    mdb = app_module._get_mongo_db()
+    if mdb is None:
+        print('MongoDB not configured (set MONGODB_URI).')
+        return 2
+
+    if args.status:
+        version = app_module._price_index_schema_version(mdb, doc_id)
+        print(json.dumps({
+            'version': version,
+            'target': migrations[-1][0],
+            'pending': [d for v, d, _ in migrations if v > version],
+        }, indent=2))
+        return 0
+
+    result = apply(force=args.force, wait=args.wait)
+    print(json.dumps(result, indent=2))
+    return 0 if result.get('success') else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+"""
+Stress test: many buyers hit POST /api/order for the same sell listing at
+once. The listing must never be oversold.
+
+Creates one approved listing with --stock kg, then starts --buyers worker
+processes (each with its own Flask test client and --threads threads) that
+all try to buy --qty kg. Afterwards it checks that
+ - accepted purchases * qty == stock taken from the listing, and never more
+   than the stock
+ - every accepted purchase has its own saved buy order
+ - the listing is `completed` with quantity 0 once it sells out
+
+Backends:
+ - default: the file store (`_OrdersJournalStore`) in a temporary directory
+ - --mongo: MONGODB_URI, in a scratch database `<db>_stress_buyers` that is
+   dropped afterwards
+
+Run:
+$ python scripts/stress_concurrent_buyers.py
+$ python scripts/stress_concurrent_buyers.py --buyers 8 --threads 8 --stock 100 --qty 3
+$ MONGODB_URI=... python scripts/stress_concurrent_buyers.py --mongo
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+LISTING_ID = 1_700_000_000_000
+
+
+def _use_backend(orders_path, mongo_db_name):
+    if mongo_db_name:
+        mdb = app_module._get_mongo_db()
+        app_module.mongo_db = mdb.client[mongo_db_name]
+    else:
+        app_module.mongo_db = None
+        app_module._get_mongo_db = lambda: None
+        app_module._ORDERS_STORE['store'] = app_module._OrdersJournalStore(orders_path)
+
+
+def _buyer(worker, threads, qty, orders_path, mongo_db_name, start_at, results):
+    _use_backend(orders_path, mongo_db_name)
+    outcomes = []
+    lock = threading.Lock()
+
+    def run(t):
+        client = app_module.app.test_client()
+        with client.session_transaction() as sess:
+            sess['user'] = f'buyer{worker}-{t}@example.com'
+        while time.time() < start_at:
+            time.sleep(0.001)
+        resp = client.post('/api/order', json={
+            'type': 'buy', 'product': 'Onion', 'quantity': qty, 'price': 20, 'listing_id': LISTING_ID,
+        })
+        body = resp.get_json() or {}
+        with lock:
+            outcomes.append((resp.status_code, bool(body.get('success')), (body.get('order') or {}).get('id')))
+
+    pool = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for th in pool:
+        th.start()
+    for th in pool:
+        th.join()
+    results.extend(outcomes)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--buyers', type=int, default=6, help='worker processes')
+    parser.add_argument('--threads', type=int, default=6, help='concurrent buyers per process')
+    parser.add_argument('--stock', type=float, default=50)
+    parser.add_argument('--qty', type=float, default=2)
+    parser.add_argument('--mongo', action='store_true')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix='stress_buyers_')
+    orders_path = os.path.join(tmp, 'orders.json')
+    mongo_db_name = None
+    if args.mongo:
+        mdb = app_module._get_mongo_db()
+        if mdb is None:
+            print('MongoDB not configured (set MONGODB_URI).')
+            return 2
+        mongo_db_name = f'{mdb.name}_stress_buyers'
+        mdb.client.drop_database(mongo_db_name)
+    _use_backend(orders_path, mongo_db_name)
+    if args.mongo:
+        app_module.apply_order_index_migrations()
+
+    app_module.append_order({
+        'id': LISTING_ID, 'user': 'seller@example.com', 'type': 'sell', 'product': 'Onion',
+        'quantity': str(int(args.stock)) if float(args.stock).is_integer() else str(args.stock),
+        'price': 20, 'status': 'approved', 'timestamp': time.time(),
+    })
+
+    manager = multiprocessing.Manager()
+    results = manager.list()
+    start_at = time.time() + 1.5
+    procs = [
+        multiprocessing.Process(target=_buyer, args=(w, args.threads, args.qty, orders_path, mongo_db_name, start_at, results))
+        for w in range(args.buyers)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+
+    if not args.mongo:
+        app_module._ORDERS_STORE['store'] = app_module._OrdersJournalStore(orders_path)
+    listing = app_module.get_order_by_id(LISTING_ID) or {}
+    accepted = [r for r in results if r[1]]
+    rejected = [r for r in results if not r[1]]
+    saved_ids = {r[2] for r in accepted}
+    buy_orders = app_module.find_orders(order_type='buy')
+    remaining = float(listing.get('quantity') or 0)
+    expected_accepted = min(len(results), int(args.stock // args.qty))
+    sold_out = expected_accepted * args.qty == args.stock
+
+    checks = {
+        'no oversell': len(accepted) * args.qty <= args.stock,
+        'stock accounted': abs((args.stock - remaining) - len(accepted) * args.qty) < 1e-6,
+        'all possible sales made': len(accepted) == expected_accepted,
+        'one saved order per sale': len(saved_ids) == len(accepted) == len(buy_orders),
+        'sold-out listing completed': not sold_out or (listing.get('status') == 'completed' and remaining == 0),
+    }
+    print(f'{len(results)} attempts: {len(accepted)} accepted, {len(rejected)} rejected '
+          f'(status codes {sorted({r[0] for r in rejected})}); listing quantity={listing.get("quantity")} '
+          f'status={listing.get("status")}')
+    for name, ok in checks.items():
+        print(f'  {"ok  " if ok else "FAIL"} {name}')
+
+    if args.mongo:
+        mdb = app_module._get_mongo_db()
+        mdb.client.drop_database(mongo_db_name)
+    shutil.rmtree(tmp, ignore_errors=True)
+    return 0 if all(checks.values()) else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
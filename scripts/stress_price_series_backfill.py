@@ -0,0 +1,109 @@
+"""
+Stress test: `_price_series_scan` readers running while `_price_series_append`
+backfills older dates (each backfill rewrites the series into a new
+generation).
+
+A writer keeps backfilling earlier days into one commodity's series in a
+temporary PRICE_SERIES_DIR while --readers threads scan it in a loop. Each
+reader reads meta.json, waits --gap-ms, and only then maps the columns. That
+is the window where a reader holds the previous meta while a rewrite
+publishes the next one. It fails if any scan raises (for example
+FileNotFoundError on a retired generation), returns rows that are not sorted
+by date, or if the final series does not hold every row that was written.
+
+Run:
+$ python scripts/stress_price_series_backfill.py
+$ python scripts/stress_price_series_backfill.py --backfills 200 --readers 8 --gap-ms 5
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import app as app_module
+
+COMMODITY = 'Onion'
+MARKETS = [('Maharashtra', 'Nashik', 'Lasalgaon'), ('Karnataka', 'Bangalore', 'Binny Mill')]
+
+
+def rows_for(day):
+    return [
+        {'price_date': day.isoformat(), 'state': s, 'district': d, 'market': m,
+         'min_price_per_kg': 10.0, 'max_price_per_kg': 20.0, 'modal_price_per_kg': 15.0}
+        for s, d, m in MARKETS
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--backfills', type=int, default=120)
+    parser.add_argument('--readers', type=int, default=6)
+    parser.add_argument('--gap-ms', type=float, default=2.0, help='pause between reading meta and mapping columns')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix='price_series_stress_')
+    os.environ['PRICE_SERIES_DIR'] = tmp
+    path = app_module._price_series_dir(COMMODITY)
+    latest = date(2026, 10, 1)
+    app_module._price_series_append(COMMODITY, rows_for(latest))
+
+    real_read_meta = app_module._price_series_read_meta
+
+    def slow_read_meta(p):
+        meta = real_read_meta(p)
+        if threading.current_thread().name.startswith('reader'):
+            time.sleep(args.gap_ms / 1000.0)
+        return meta
+
+    app_module._price_series_read_meta = slow_read_meta
+
+    stop = threading.Event()
+    errors = []
+    scans = [0]
+
+    def reader():
+        while not stop.is_set():
+            try:
+                out = app_module._price_series_scan(COMMODITY)
+                dates = out['date'].tolist() if out else []
+                if dates != sorted(dates):
+                    errors.append('unsorted scan')
+                scans[0] += 1
+            except Exception as e:
+                errors.append(f'{type(e).__name__}: {e}')
+
+    threads = [threading.Thread(target=reader, name=f'reader-{i}', daemon=True) for i in range(args.readers)]
+    for th in threads:
+        th.start()
+    rewrites = 0
+    try:
+        for i in range(1, args.backfills + 1):
+            summary = app_module._price_series_append(COMMODITY, rows_for(latest - timedelta(days=i)))
+            rewrites += bool(summary.get('rewritten'))
+    finally:
+        stop.set()
+        for th in threads:
+            th.join()
+
+    meta = real_read_meta(path)
+    expected_rows = (args.backfills + 1) * len(MARKETS)
+    generations = sorted({f.split('.')[1] for f in os.listdir(path) if f.endswith('.bin')})
+    ok = not errors and int(meta.get('rows') or 0) == expected_rows and len(generations) <= 2
+    print(f'{args.backfills} backfills ({rewrites} rewrites), {scans[0]} concurrent scans, '
+          f'{len(errors)} errors, rows={meta.get("rows")}/{expected_rows}, generations on disk={generations}')
+    for err in sorted(set(errors))[:5]:
+        print('  ', err)
+    shutil.rmtree(tmp, ignore_errors=True)
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())